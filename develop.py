@@ -265,13 +265,15 @@ def http_retrieve_url( url, destination, headers = None ):
 
 def _http_retrieve_url( request, destination ):
     from contextlib import ExitStack as ContextStack
+    from shutil import copyfileobj
     from urllib.request import urlopen as access_url
     contexts = ContextStack( )
     with contexts:
         # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected
         http_reader = contexts.enter_context( access_url( request ) )
         file = contexts.enter_context( destination.open( 'wb' ) )
-        file.write( http_reader.read( ) )
+        # Stream in chunks rather than hold entire response in memory.
+        copyfileobj( http_reader, file, 1 << 20 )
         return destination
 
 
@@ -8,14 +8,87 @@
 """
 
 
-def _prepare( ):
-    from pathlib import Path
-    project_location = Path( __file__ ).parent.parent.parent
-    from importlib.util import module_from_spec, spec_from_file_location
-    module_spec = spec_from_file_location(
-        '_develop', project_location / 'develop.py' )
-    module = module_from_spec( module_spec )
-    module_spec.loader.exec_module( module )
+from os.path import abspath as _abspath, dirname as _dirname
+_project_location = _dirname( _dirname( _dirname( _abspath( __file__ ) ) ) )
+
+
+def _prepare( project_location ):
+    from os import environ as current_process_environment
+    # Discovery also installs prerequisites on ReadTheDocs; never skip it.
+    if 'True' == current_process_environment.get( 'READTHEDOCS', 'False' ):
+        return _discover_information( project_location )
+    # Cache within the Sphinx doctrees cache, so that cleaning one cleans both.
+    # Note: A cache hit skips 'develop.py' and so does not ensure devshim.
+    from os.path import join as join_path
+    cache_location = join_path(
+        project_location,
+        '.local', 'caches', 'sphinx', 'conf-information.json' )
+    digest = _calculate_information_digest( project_location )
+    information = _restore_information( cache_location, digest )
+    if None is information:
+        information = _discover_information( project_location )
+        _save_information( cache_location, digest, information )
+    return information
+
+
+def _calculate_information_digest( project_location ):
+    # Project information is read from 'pyproject.toml' by devshim.
+    # This file determines the shape of the cached record.
+    # Note: The devshim version is not part of the digest. If devshim changes
+    #       how it derives the information, then remove the cached record.
+    from hashlib import sha256
+    from os.path import join as join_path
+    hasher = sha256( )
+    for location in (
+        join_path( project_location, 'pyproject.toml' ), __file__
+    ):
+        with open( location, 'rb' ) as file: hasher.update( file.read( ) )
+    return hasher.hexdigest( )
+
+
+def _restore_information( location, digest ):
+    from json import load as load_json
+    try:
+        with open( location, 'r', encoding = 'utf-8' ) as file:
+            record = load_json( file )
+    except ( OSError, ValueError ): return None
+    if not isinstance( record, dict ) or digest != record.get( 'digest' ):
+        return None
+    return record.get( 'information' )
+
+
+def _save_information( location, digest, information ):
+    from json import dump as dump_json
+    from os import makedirs, remove, replace
+    from os.path import dirname
+    from tempfile import NamedTemporaryFile
+    # Caching is an optimization; not a requirement. So, ignore failures.
+    location_ = None
+    try:
+        makedirs( dirname( location ), exist_ok = True )
+        # Replace atomically, so that concurrent builds never read partials.
+        with NamedTemporaryFile(
+            'w', encoding = 'utf-8', dir = dirname( location ),
+            prefix = '.conf-information-', suffix = '.tmp', delete = False,
+        ) as file:
+            location_ = file.name
+            dump_json(
+                dict( digest = digest, information = information ), file )
+        replace( location_, location )
+    except OSError:
+        if None is not location_:
+            try: remove( location_ )
+            except OSError: pass
+
+
+def _discover_information( project_location ):
+    # Import through the module cache so that repeated evaluations of this
+    # file, within the same process, do not re-execute 'develop.py'.
+    from importlib import import_module
+    from sys import path as python_search_paths
+    python_search_paths.insert( 0, project_location )
+    try: module = import_module( 'develop' )
+    finally: python_search_paths.remove( project_location )
     package_discovery_manager, packages_cache_manager = (
         module.ensure_sanity( ) )
     from os import environ as current_process_environment
@@ -31,79 +104,106 @@ def _prepare( ):
                 domain = 'development.documentation',
                 excludes = ( 'sphinx', ) )
         from devshim.project import discover_information # pylint: disable=import-error
-        return discover_information( )
+        return _summarize_information( discover_information( ) )
+
 
-_information = _prepare( )
+def _summarize_information( information ):
+    # Only the few scalars, which this configuration actually uses, are kept.
+    project_ = information[ 'name' ]
+    return {
+        'project': project_,
+        'release': information[ 'version' ],
+        'author': information[ 'authors' ][ 0 ][ 'name' ],
+        'year-of-origin': information[ 'year-of-origin' ],
+        'rst-prolog': f"\n.. |project| replace:: {project_}\n",
+    }
+
+_information = _prepare( _project_location )
 
 
 # -- Project information -----------------------------------------------------
 
-def _calculate_copyright_notice( information, author_ ):
-    from datetime import datetime as DateTime
-    first_year = information[ 'year-of-origin' ]
-    now_year = DateTime.utcnow( ).year
+def _calculate_copyright_notice( first_year, author_ ):
+    from time import gmtime
+    now_year = gmtime( ).tm_year
     if first_year < now_year: year_range = f"{first_year}-{now_year}"
     else: year_range = str( first_year )
     return f"{year_range}, {author_}"
 
-project = _information[ 'name' ]
-release = _information[ 'version' ]
-author = _information[ 'authors' ][ 0 ][ 'name' ]
-project_copyright = _calculate_copyright_notice( _information, author )
+project = _information[ 'project' ]
+release = _information[ 'release' ]
+author = _information[ 'author' ]
+project_copyright = _calculate_copyright_notice(
+    _information[ 'year-of-origin' ], author )
 
 
 # -- General configuration ---------------------------------------------------
 
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom ones.
-extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.graphviz',
-    'sphinx.ext.intersphinx',
-    'sphinx.ext.todo',
-    'sphinx_copybutton',
-    'sphinx_inline_tabs',
-]
+# Set 'FAST_DOCS=1' in the environment to skip loading of the optional
+# extensions during local iterative editing. Ignored on ReadTheDocs.
+def _select_extensions( ):
+    from os import environ as current_process_environment
+    extensions_ = [ 'sphinx.ext.autodoc', 'sphinx.ext.intersphinx', ]
+    if (    '1' == current_process_environment.get( 'FAST_DOCS' )
+        and 'True' != current_process_environment.get( 'READTHEDOCS', 'False' )
+    ): return extensions_
+    extensions_.extend( (
+        'sphinx.ext.graphviz',
+        'sphinx.ext.todo',
+        'sphinx_copybutton',
+        'sphinx_inline_tabs',
+    ) )
+    return extensions_
+
+extensions = _select_extensions( )
 
 # Add any paths that contain templates here, relative to this directory.
+# Note: Must remain a list; Sphinx warns about other sequence types here.
 templates_path = ['_templates']
 
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
+# Note: Must remain a list; Sphinx warns about other sequence types here.
 exclude_patterns = []
 
-rst_prolog = f'''
-.. |project| replace:: {project}
-'''
+rst_prolog = _information[ 'rst-prolog' ]
 
 nitpicky = True
-nitpick_ignore = [
-    # Workaround for https://bugs.python.org/issue11975
-    # Found on Stack Overflow (credit to Astropy project):
-    #   https://stackoverflow.com/a/30624034
-    ( 'py:class', "module", ),
-    ( 'py:class', "mappingproxy", ),
-    ( 'py:class', "integer -- return first index of value.", ),
-    ( 'py:class', "integer -- return number of occurrences of value", ),
-    ( 'py:class', "a set-like object providing a view on D's keys", ),
-    ( 'py:class', "an object providing a view on D's values", ),
-    ( 'py:class', "a set-like object providing a view on D's items", ),
-    ( 'py:class', "D[k] if k in D, else d.  d defaults to None.", ),
-    ( 'py:class', "None.  Update D from mapping/iterable E and F.", ),
-    ( 'py:class', "D.get(k,d), also set D[k]=d if k not in D", ),
-    ( 'py:class', "(k, v), remove and return some (key, value) pair", ),
-    ( 'py:class',
-      "v, remove specified key and return the corresponding value.", ),
-    ( 'py:class', "None.  Remove all items from D.", ),
-]
+from sys import intern as _intern
+nitpick_ignore = tuple(
+    ( _intern( domain ), _intern( target ) )
+    for domain, target in (
+        # Workaround for https://bugs.python.org/issue11975
+        # Found on Stack Overflow (credit to Astropy project):
+        #   https://stackoverflow.com/a/30624034
+        ( 'py:class', "module", ),
+        ( 'py:class', "mappingproxy", ),
+        ( 'py:class', "integer -- return first index of value.", ),
+        ( 'py:class', "integer -- return number of occurrences of value", ),
+        ( 'py:class', "a set-like object providing a view on D's keys", ),
+        ( 'py:class', "an object providing a view on D's values", ),
+        ( 'py:class', "a set-like object providing a view on D's items", ),
+        ( 'py:class', "D[k] if k in D, else d.  d defaults to None.", ),
+        ( 'py:class', "None.  Update D from mapping/iterable E and F.", ),
+        ( 'py:class', "D.get(k,d), also set D[k]=d if k not in D", ),
+        ( 'py:class', "(k, v), remove and return some (key, value) pair", ),
+        ( 'py:class',
+          "v, remove specified key and return the corresponding value.", ),
+        ( 'py:class', "None.  Remove all items from D.", ),
+    ) )
 
 # -- Options for linkcheck builder -------------------------------------------
 
+# Note: Sphinx compiles these patterns once per build.
+#       Escape interpolated names so that they match literally.
+from re import escape as _escape_regex
 linkcheck_ignore = [
     # Circular dependency between building HTML and publishing it.
     # Ideally, we want to warn on failure rather than ignore.
-    fr'https://emcd\.github\.io/.*{project}.*/.*',
+    fr'https://emcd\.github\.io/.*{_escape_regex( project )}.*/.*',
 ]
 
 # -- Options for HTML output -------------------------------------------------
@@ -119,6 +219,7 @@ html_theme_options = {
 # Add any paths that contain custom static files (such as style sheets) here,
 # relative to this directory. They are copied after the builtin static files,
 # so a file named "default.css" will overwrite the builtin "default.css".
+# Note: Must remain a list; extensions and Sphinx itself extend it.
 html_static_path = ['_static']
 
 
@@ -137,10 +238,15 @@ todo_include_todos = True
 
 # -- Options for autodoc extension -------------------------------------------
 
+# Enable inherited members per directive, where needed. E.g.:
+#   .. autoclass:: Foo
+#      :inherited-members:
+# Note: 'members' must be explicit; 'inherited-members' no longer implies it.
 autodoc_default_options = {
     'member-order': 'bysource',
+    'members': True,
     'imported-members': False,
-    'inherited-members': True,
+    'inherited-members': False,
     'show-inheritance': True,
     'undoc-members': True,
 }